@@ -6,3 +6,21 @@ load_dotenv()
 def get_cors_origins():
     raw = os.getenv("CORS_ORIGINS", "")
     return [o.strip() for o in raw.split(",") if o.strip()]
+
+# 🔑 Caché de tokens JWT verificados (token -> identidad del usuario). 0 la desactiva.
+# No hay invalidación: si se borra un usuario o cambia su email, sus tokens siguen
+# autenticando desde la caché hasta TOKEN_CACHE_TTL_SECONDS (o el `exp` del token, lo que ocurra antes).
+TOKEN_CACHE_MAXSIZE = int(os.getenv("TOKEN_CACHE_MAXSIZE", "1024"))
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
+
+# 🔐 Hashing de contraseñas (bcrypt)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+HASH_POOL_WORKERS = int(os.getenv("HASH_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Máximo de registros/logins con cupo de bcrypt (en cola o en curso). Un request sin cupo
+# espera hasta HASH_QUEUE_WAIT_SECONDS a que se libere uno y recién entonces recibe 503.
+HASH_QUEUE_MAX = int(os.getenv("HASH_QUEUE_MAX", str(HASH_POOL_WORKERS * 8)))
+HASH_QUEUE_WAIT_SECONDS = float(os.getenv("HASH_QUEUE_WAIT_SECONDS", "5"))
+# Registros/logins simultáneos por IP de cliente
+AUTH_MAX_CONCURRENT_PER_IP = int(os.getenv("AUTH_MAX_CONCURRENT_PER_IP", "2"))
+# Proxies de confianza delante de la app (Render = 1). Con 0 se ignora X-Forwarded-For.
+TRUSTED_PROXY_HOPS = int(os.getenv("TRUSTED_PROXY_HOPS", "0"))
@@ -1,25 +1,62 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from db.session import get_db
 from db.models import Usuario
-from utils.security import hash_password, verify_password, create_access_token
+from utils.security import cupo_hash, hash_password_async, verify_and_update_password_async, create_access_token
+from utils.rate_limit import limitador_auth, ip_cliente
+from utils.auth_handler import dependencia_usuario_actual
+from utils.token_cache import UsuarioActual
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-@router.post("/register")
-def register(nombre: str, email: str, password: str, db: Session = Depends(get_db)):
-    user = db.query(Usuario).filter(Usuario.email == email).first()
-    if user:
-        raise HTTPException(status_code=400, detail="El correo ya está registrado.")
-    nuevo = Usuario(nombre=nombre, email=email, password=hash_password(password))
-    db.add(nuevo)
+# Las consultas son síncronas (SQLAlchemy): se ejecutan en el threadpool para no bloquear el event loop,
+# mientras que bcrypt corre en su propio pool (ver utils/security.py). Las lecturas cierran su
+# transacción antes de esperar a bcrypt, para devolver la conexión al pool de SQLAlchemy.
+
+def _email_registrado(db: Session, email: str) -> bool:
+    existe = db.query(Usuario.id).filter(Usuario.email == email).first() is not None
+    db.rollback()
+    return existe
+
+def _crear_usuario(db: Session, nombre: str, email: str, password_hash: str) -> None:
+    db.add(Usuario(nombre=nombre, email=email, password=password_hash))
     db.commit()
+
+def _credenciales(db: Session, email: str):
+    # Solo id, email canónico y hash: no hace falta cargar la fila completa del usuario
+    user = db.query(Usuario.id, Usuario.email, Usuario.password).filter(Usuario.email == email).first()
+    db.rollback()
+    return user
+
+def _actualizar_hash(db: Session, user_id: int, password_hash: str) -> None:
+    db.query(Usuario).filter(Usuario.id == user_id).update({Usuario.password: password_hash})
+    db.commit()
+
+@router.post("/register")
+async def register(request: Request, nombre: str, email: str, password: str, db: Session = Depends(get_db)):
+    async with limitador_auth.ocupar(ip_cliente(request)), cupo_hash():
+        if await run_in_threadpool(_email_registrado, db, email):
+            raise HTTPException(status_code=400, detail="El correo ya está registrado.")
+        password_hash = await hash_password_async(password)
+        await run_in_threadpool(_crear_usuario, db, nombre, email, password_hash)
     return {"ok": True, "mensaje": "Usuario registrado correctamente"}
 
 @router.post("/login")
-def login(email: str, password: str, db: Session = Depends(get_db)):
-    user = db.query(Usuario).filter(Usuario.email == email).first()
-    if not user or not verify_password(password, user.password):
-        raise HTTPException(status_code=401, detail="Credenciales incorrectas")
+async def login(request: Request, email: str, password: str, db: Session = Depends(get_db)):
+    async with limitador_auth.ocupar(ip_cliente(request)), cupo_hash():
+        user = await run_in_threadpool(_credenciales, db, email)
+        if not user:
+            raise HTTPException(status_code=401, detail="Credenciales incorrectas")
+        valida, nuevo_hash = await verify_and_update_password_async(password, user.password)
+        if not valida:
+            raise HTTPException(status_code=401, detail="Credenciales incorrectas")
+        # Rehash transparente si cambió el costo de bcrypt
+        if nuevo_hash:
+            await run_in_threadpool(_actualizar_hash, db, user.id, nuevo_hash)
     token = create_access_token({"sub": user.email})
     return {"ok": True, "access_token": token, "usuario": user.email}
+
+@router.get("/me")
+def me(usuario: UsuarioActual = Depends(dependencia_usuario_actual)):
+    return {"ok": True, "id": usuario.id, "usuario": usuario.email}
@@ -0,0 +1,92 @@
+"""
+Micro-benchmark de la verificación de JWT + búsqueda del usuario (utils/auth_handler).
+
+Compara, por request:
+  - antes:  doble jwt.decode (JWTBearer + handler) + fila completa de Usuario
+  - frío:   un jwt.decode + SELECT id, email + guardado en caché
+  - tibio:  token ya en caché (sin decode ni DB)
+
+Es un loop de un solo hilo sobre SQLite en memoria: no hay round trip de red
+ni concurrencia. Para la latencia bajo carga a través de la dependencia real
+(GET /auth/me) ver scripts/loadtest_auth.py.
+
+Uso (desde backend/):  python scripts/bench_token_cache.py [-n 5000]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jwt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from db.session import Base
+from db.models import Usuario
+from utils.auth_handler import obtener_usuario_actual
+from utils.security import SECRET_KEY, ALGORITHM, create_access_token
+from utils import token_cache
+from estadisticas import percentil
+
+
+def medir(fn, n: int) -> list[float]:
+    tiempos = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        tiempos.append((time.perf_counter() - t0) * 1e6)
+    return tiempos
+
+
+def resumen(nombre: str, tiempos: list[float]) -> None:
+    print(
+        f"{nombre:<8} media={statistics.mean(tiempos):8.1f} µs  "
+        f"p50={percentil(tiempos, 0.50):8.1f} µs  p99={percentil(tiempos, 0.99):8.1f} µs"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=5000, help="iteraciones por escenario")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Usuario(nombre="Bench", email="bench@example.com", password="x"))
+    db.commit()
+
+    token = create_access_token({"sub": "bench@example.com"})
+
+    def antes():
+        jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        db.query(Usuario).filter(Usuario.email == payload["sub"]).first()
+        db.expire_all()
+
+    def frio():
+        token_cache.limpiar()
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        obtener_usuario_actual(token, db, payload)
+
+    def tibio():
+        obtener_usuario_actual(token, db)
+
+    t_antes = medir(antes, args.n)
+    t_frio = medir(frio, args.n)
+    obtener_usuario_actual(token, db)
+    t_tibio = medir(tibio, args.n)
+
+    resumen("antes", t_antes)
+    resumen("frío", t_frio)
+    resumen("tibio", t_tibio)
+    ahorro = statistics.mean(t_antes) - statistics.mean(t_tibio)
+    print(f"ahorro por request con caché tibia: {ahorro:.1f} µs (sin contar la latencia de red de MySQL)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""Utilidades compartidas por los scripts de benchmark y prueba de carga."""
+import math
+
+
+def percentil(valores: list[float], p: float) -> float:
+    """Percentil por rango más cercano (p entre 0 y 1)"""
+    if not valores:
+        return float("nan")
+    ordenados = sorted(valores)
+    return ordenados[max(0, math.ceil(len(ordenados) * p) - 1)]
+
+
+def resumen(nombre: str, tiempos_ms: list[float]) -> None:
+    """Imprime n, p50 y p99 de una serie de latencias en milisegundos"""
+    print(
+        f"{nombre:<28} n={len(tiempos_ms):5d}  "
+        f"p50={percentil(tiempos_ms, 0.50):8.1f} ms  p99={percentil(tiempos_ms, 0.99):8.1f} ms"
+    )
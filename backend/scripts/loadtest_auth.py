@@ -0,0 +1,52 @@
+"""
+Prueba de carga de una ruta autenticada: GET /auth/me (dependencia_usuario_actual).
+
+Hace login una vez y luego --clientes clientes concurrentes consultan /auth/me
+con el mismo token durante --duracion segundos. Imprime p50/p99 y req/s.
+
+Para medir lo que ahorra la caché de tokens, correr el servidor dos veces:
+    TOKEN_CACHE_MAXSIZE=0 uvicorn main:app --port 8000   # sin caché
+    uvicorn main:app --port 8000                         # con caché
+    python scripts/loadtest_auth.py --email demo@example.com --password demo
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from estadisticas import resumen
+
+
+async def cliente(client: httpx.AsyncClient, headers: dict, hasta: float, tiempos: list[float]) -> None:
+    while time.perf_counter() < hasta:
+        t0 = time.perf_counter()
+        r = await client.get("/auth/me", headers=headers)
+        r.raise_for_status()
+        tiempos.append((time.perf_counter() - t0) * 1000)
+
+
+async def main(args) -> None:
+    limites = httpx.Limits(max_connections=args.clientes + 5)
+    async with httpx.AsyncClient(base_url=args.url, timeout=60, limits=limites) as client:
+        r = await client.post("/auth/login", params={"email": args.email, "password": args.password})
+        r.raise_for_status()
+        headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+        tiempos: list[float] = []
+        hasta = time.perf_counter() + args.duracion
+        await asyncio.gather(*(cliente(client, headers, hasta, tiempos) for _ in range(args.clientes)))
+
+    resumen("GET /auth/me", tiempos)
+    print(f"{len(tiempos) / args.duracion:.0f} req/s con {args.clientes} clientes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--clientes", type=int, default=20, help="clientes concurrentes")
+    parser.add_argument("--duracion", type=float, default=10.0, help="segundos de carga")
+    main_args = parser.parse_args()
+    asyncio.run(main(main_args))
@@ -0,0 +1,91 @@
+"""
+Prueba de carga: latencia de GET /movimientos durante una ráfaga de logins.
+
+1. Línea base: consulta GET /movimientos sin carga durante --duracion-base segundos.
+2. Ráfaga: lanza --logins llamadas a POST /auth/login (--concurrencia a la vez)
+   mientras sigue consultando GET /movimientos.
+
+Imprime p50/p99 de /movimientos en ambas fases y el resumen de los logins
+(los 429/503 son los límites de utils/rate_limit.py y utils/security.py).
+
+Requiere un usuario existente y el servidor corriendo, p. ej. (desde backend/):
+    uvicorn main:app --port 8000
+    python scripts/loadtest_login.py --email demo@example.com --password demo
+
+Con --ips-distintas cada login manda un X-Forwarded-For distinto, simulando
+muchos clientes (el servidor debe tener TRUSTED_PROXY_HOPS >= 1).
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+
+import httpx
+
+from estadisticas import resumen
+
+
+async def consultar_movimientos(client: httpx.AsyncClient, hasta: asyncio.Event, tiempos: list[float]) -> None:
+    while not hasta.is_set():
+        t0 = time.perf_counter()
+        r = await client.get("/movimientos")
+        r.raise_for_status()
+        tiempos.append((time.perf_counter() - t0) * 1000)
+
+
+async def rafaga_logins(client: httpx.AsyncClient, args, tiempos: list[float], estados: Counter) -> None:
+    sem = asyncio.Semaphore(args.concurrencia)
+
+    async def un_login(i: int) -> None:
+        headers = {"X-Forwarded-For": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}"} if args.ips_distintas else {}
+        async with sem:
+            t0 = time.perf_counter()
+            r = await client.post(
+                "/auth/login", params={"email": args.email, "password": args.password}, headers=headers
+            )
+            tiempos.append((time.perf_counter() - t0) * 1000)
+            estados[r.status_code] += 1
+
+    await asyncio.gather(*(un_login(i) for i in range(args.logins)))
+
+
+async def main(args) -> None:
+    limites = httpx.Limits(max_connections=args.concurrencia + 10)
+    async with httpx.AsyncClient(base_url=args.url, timeout=60, limits=limites) as client:
+        # Fase 1: línea base
+        base: list[float] = []
+        fin = asyncio.Event()
+        tarea = asyncio.create_task(consultar_movimientos(client, fin, base))
+        await asyncio.sleep(args.duracion_base)
+        fin.set()
+        await tarea
+
+        # Fase 2: ráfaga de logins
+        durante: list[float] = []
+        logins: list[float] = []
+        estados: Counter = Counter()
+        fin = asyncio.Event()
+        tarea = asyncio.create_task(consultar_movimientos(client, fin, durante))
+        t0 = time.perf_counter()
+        await rafaga_logins(client, args, logins, estados)
+        duracion = time.perf_counter() - t0
+        fin.set()
+        await tarea
+
+    resumen("GET /movimientos (base)", base)
+    resumen("GET /movimientos (ráfaga)", durante)
+    resumen("POST /auth/login", logins)
+    print(f"logins: {args.logins} en {duracion:.1f} s, estados: {dict(sorted(estados.items()))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=200, help="total de logins en la ráfaga")
+    parser.add_argument("--concurrencia", type=int, default=50, help="logins simultáneos")
+    parser.add_argument("--duracion-base", type=float, default=3.0, help="segundos de línea base")
+    parser.add_argument("--ips-distintas", action="store_true", help="un X-Forwarded-For distinto por login")
+    main_args = parser.parse_args()
+    asyncio.run(main(main_args))
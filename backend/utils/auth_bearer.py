@@ -1,6 +1,8 @@
+from typing import Optional
 from fastapi import Request, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from utils.security import SECRET_KEY, ALGORITHM
+from utils import token_cache
 import jwt
 
 class JWTBearer(HTTPBearer):
@@ -12,15 +14,20 @@ class JWTBearer(HTTPBearer):
         if credentials:
             if not credentials.scheme == "Bearer":
                 raise HTTPException(status_code=403, detail="Formato de token inválido.")
-            if not self.verify_jwt(credentials.credentials):
-                raise HTTPException(status_code=403, detail="Token inválido o expirado.")
-            return credentials.credentials
+            token = credentials.credentials
+            # Token ya verificado y vigente: no hace falta decodificarlo otra vez
+            if token_cache.obtener(token) is None:
+                payload = self.decode_jwt(token)
+                if payload is None:
+                    raise HTTPException(status_code=403, detail="Token inválido o expirado.")
+                # Se reutiliza en obtener_usuario_actual para decodificar una sola vez
+                request.state.jwt_payload = payload
+            return token
         else:
             raise HTTPException(status_code=403, detail="Autenticación requerida.")
 
-    def verify_jwt(self, token: str) -> bool:
+    def decode_jwt(self, token: str) -> Optional[dict]:
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            return True
+            return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         except Exception:
-            return False
+            return None
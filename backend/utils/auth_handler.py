@@ -1,21 +1,42 @@
-from fastapi import Depends, HTTPException
+from typing import Optional
+from fastapi import Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from db.session import get_db
 from db.models import Usuario
+from utils.auth_bearer import JWTBearer
 from utils.security import SECRET_KEY, ALGORITHM
+from utils.token_cache import UsuarioActual
+from utils import token_cache
 import jwt
 
-def obtener_usuario_actual(token: str, db: Session):
+def obtener_usuario_actual(token: str, db: Session, payload: Optional[dict] = None) -> UsuarioActual:
+    usuario = token_cache.obtener(token)
+    if usuario is not None:
+        return usuario
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        if payload is None:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email = payload.get("sub")
         if email is None:
             raise HTTPException(status_code=403, detail="Token inválido.")
-        user = db.query(Usuario).filter(Usuario.email == email).first()
+        # Solo se necesitan id y email, no la fila completa
+        user = db.query(Usuario.id, Usuario.email).filter(Usuario.email == email).first()
         if not user:
             raise HTTPException(status_code=404, detail="Usuario no encontrado.")
-        return user
+        usuario = UsuarioActual(id=user.id, email=user.email)
+        token_cache.guardar(token, usuario, payload.get("exp"))
+        return usuario
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=403, detail="El token ha expirado.")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=403, detail="Token inválido.")
+
+def dependencia_usuario_actual(
+    request: Request,
+    token: str = Depends(JWTBearer()),
+    db: Session = Depends(get_db),
+) -> UsuarioActual:
+    """Dependencia compartida para rutas autenticadas: decodifica el JWT una sola vez por request.
+    Uso: `usuario: UsuarioActual = Depends(dependencia_usuario_actual)`"""
+    payload = getattr(request.state, "jwt_payload", None)
+    return obtener_usuario_actual(token, db, payload)
@@ -0,0 +1,41 @@
+from contextlib import asynccontextmanager
+from fastapi import HTTPException, Request
+from core.config import AUTH_MAX_CONCURRENT_PER_IP, TRUSTED_PROXY_HOPS
+
+
+class LimitadorConcurrencia:
+    """Limita cuántas peticiones simultáneas puede tener una misma clave (p. ej. una IP).
+    Solo se usa desde el event loop, así que no necesita locks."""
+
+    def __init__(self, max_por_clave: int):
+        self.max_por_clave = max_por_clave
+        self._activos: dict[str, int] = {}
+
+    @asynccontextmanager
+    async def ocupar(self, clave: str):
+        activos = self._activos.get(clave, 0)
+        if activos >= self.max_por_clave:
+            raise HTTPException(status_code=429, detail="Demasiados intentos simultáneos. Intenta de nuevo.")
+        self._activos[clave] = activos + 1
+        try:
+            yield
+        finally:
+            restantes = self._activos[clave] - 1
+            if restantes:
+                self._activos[clave] = restantes
+            else:
+                del self._activos[clave]
+
+
+def ip_cliente(request: Request) -> str:
+    """IP real del cliente. Detrás de TRUSTED_PROXY_HOPS proxies se toma de X-Forwarded-For,
+    contando desde la derecha (las entradas de la izquierda las puede falsificar el cliente)."""
+    if TRUSTED_PROXY_HOPS > 0:
+        saltos = [ip.strip() for ip in request.headers.get("x-forwarded-for", "").split(",") if ip.strip()]
+        if len(saltos) >= TRUSTED_PROXY_HOPS:
+            return saltos[-TRUSTED_PROXY_HOPS]
+    return request.client.host if request.client else "desconocido"
+
+
+# Compartido por /auth/login y /auth/register
+limitador_auth = LimitadorConcurrencia(AUTH_MAX_CONCURRENT_PER_IP)
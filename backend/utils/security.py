@@ -1,14 +1,52 @@
+import asyncio
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from jose import jwt
+from fastapi import HTTPException
 from passlib.context import CryptContext
+from core.config import BCRYPT_ROUNDS, HASH_POOL_WORKERS, HASH_QUEUE_MAX, HASH_QUEUE_WAIT_SECONDS
 
 # 🔐 Clave secreta para firmar los tokens JWT (puedes generar una nueva)
 SECRET_KEY = "cartolaapp_super_secret_key_123"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60  # 1 hora
 
-# Configuración de hashing para contraseñas
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Configuración de hashing para contraseñas.
+# min/max = default: si cambia BCRYPT_ROUNDS, los hashes antiguos quedan marcados para rehash.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+    bcrypt__max_rounds=BCRYPT_ROUNDS,
+)
+
+# 🧵 Pool dedicado para bcrypt: no bloquea el event loop ni el threadpool de los demás endpoints
+_hash_pool = ThreadPoolExecutor(max_workers=HASH_POOL_WORKERS, thread_name_prefix="bcrypt")
+# 🚦 Cupos para requests que usan el pool (en curso + en cola): la cola del executor no tiene límite
+_hash_cupos = asyncio.Semaphore(HASH_QUEUE_MAX)
+
+@asynccontextmanager
+async def cupo_hash():
+    """Reserva un cupo de bcrypt para todo el request (antes de tocar la DB).
+    Espera hasta HASH_QUEUE_WAIT_SECONDS; si no se libera ninguno responde 503."""
+    try:
+        await asyncio.wait_for(_hash_cupos.acquire(), HASH_QUEUE_WAIT_SECONDS)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=503,
+            detail="Servidor ocupado. Intenta de nuevo en unos segundos.",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        yield
+    finally:
+        _hash_cupos.release()
+
+async def _en_pool_hash(fn, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, fn, *args)
 
 def hash_password(password: str) -> str:
     """Devuelve el hash de una contraseña"""
@@ -18,6 +56,15 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifica si una contraseña coincide con su hash"""
     return pwd_context.verify(plain_password, hashed_password)
 
+async def hash_password_async(password: str) -> str:
+    """Como hash_password, pero ejecutado en el pool de bcrypt. Llamar dentro de `cupo_hash()`."""
+    return await _en_pool_hash(pwd_context.hash, password)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verifica la contraseña en el pool de bcrypt. Llamar dentro de `cupo_hash()`.
+    Devuelve (válida, nuevo_hash); nuevo_hash no es None si el hash usa parámetros antiguos."""
+    return await _en_pool_hash(pwd_context.verify_and_update, plain_password, hashed_password)
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     """Crea un token JWT firmado con SECRET_KEY"""
     to_encode = data.copy()
@@ -0,0 +1,50 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from core.config import TOKEN_CACHE_MAXSIZE, TOKEN_CACHE_TTL_SECONDS
+
+
+class UsuarioActual(NamedTuple):
+    """Identidad mínima del usuario autenticado (sin tocar la sesión de la DB)"""
+    id: int
+    email: str
+
+
+# 🧠 token -> (instante de expiración, identidad), ordenado por uso reciente
+_cache: "OrderedDict[str, tuple[float, UsuarioActual]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def obtener(token: str) -> Optional[UsuarioActual]:
+    """Devuelve la identidad cacheada del token, o None si no está o ya expiró"""
+    ahora = time.time()
+    with _lock:
+        entrada = _cache.get(token)
+        if entrada is None:
+            return None
+        expira, usuario = entrada
+        if expira <= ahora:
+            del _cache[token]
+            return None
+        _cache.move_to_end(token)
+        return usuario
+
+
+def guardar(token: str, usuario: UsuarioActual, exp: Optional[float] = None) -> None:
+    """Guarda la identidad del token; nunca más allá del `exp` del propio JWT"""
+    expira = time.time() + TOKEN_CACHE_TTL_SECONDS
+    if exp is not None:
+        expira = min(expira, float(exp))
+    with _lock:
+        _cache[token] = (expira, usuario)
+        _cache.move_to_end(token)
+        while len(_cache) > TOKEN_CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+
+
+def limpiar() -> None:
+    """Vacía la caché completa"""
+    with _lock:
+        _cache.clear()